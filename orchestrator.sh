@@ -4,20 +4,6 @@
 
 set -e
 
-PROJECT_PATH="$1"
-
-if [[ -z "$PROJECT_PATH" || ! -d "$PROJECT_PATH" ]]; then
-    echo "Usage: $0 /path/to/project"
-    exit 1
-fi
-
-PROJECT_PATH=$(realpath "$PROJECT_PATH")
-PROJECT_NAME=$(basename "$PROJECT_PATH")
-SESSION_NAME=$(echo "$PROJECT_NAME" | tr ' A-Z' '-a-z' | sed 's/^\.//g')
-
-# Get the directory where this orchestrator script is located
-ORCHESTRATOR_DIR=$(dirname "$(realpath "$0")")
-
 # Simple project type detection
 detect_project_type() {
     if [[ -f "$PROJECT_PATH/package.json" ]]; then
@@ -79,8 +65,8 @@ start_dev_server() {
     esac
 }
 
-# Send message to agent
-send_message() {
+# Paste message into agent's input without submitting it
+paste_message() {
     local target="$1"
     local message="$2"
 
@@ -94,12 +80,28 @@ send_message() {
         return 1
     fi
 
-    echo "$message" | tmux load-buffer -
-    tmux paste-buffer -t "$target" 2>/dev/null || {
+    # Load and paste in a single tmux invocation
+    echo "$message" | tmux load-buffer - \; \
+        paste-buffer -t "$target" 2>/dev/null || {
         echo "Warning: Failed to send message to $target"
         return 1
     }
-    tmux send-keys -t "$target" Enter
+}
+
+# Submit a previously pasted message
+submit_message() {
+    tmux send-keys -t "$1" Enter
+}
+
+# Send message to agent
+send_message() {
+    local target="$1"
+
+    paste_message "$target" "$2" || return 1
+
+    # Wait for UI to register the paste before submitting
+    sleep 0.5
+    submit_message "$target"
 }
 
 # Load project specs - adapt to customer's existing structure
@@ -115,32 +117,32 @@ load_custom_requirements() {
 
     echo "🔍 Looking for your project specs..." >&2
 
-    # Scan each directory if it exists
+    # Collect the directories that exist, then scan them all in one pass
+    local spec_dirs=()
     for dir in "${common_dirs[@]}"; do
-        local full_path="$project_path/$dir"
-
-        if [[ -d "$full_path" ]]; then
+        if [[ -d "$project_path/$dir" ]]; then
             echo "📁 Found: $dir/" >&2
-
-            # Read all markdown files in the directory
-            while IFS= read -r -d '' file; do
-                if [[ -f "$file" ]]; then
-                    local filename=$(basename "$file")
-                    echo "📄 Reading: $dir/$filename" >&2
-
-                    if [[ -n "$requirements" ]]; then
-                        requirements="$requirements
-
---- From $dir/$filename ---
-$(cat "$file")"
-                    else
-                        requirements="$(cat "$file")"
-                    fi
-                fi
-            done < <(find "$full_path" -name "*.md" -type f -print0 2>/dev/null)
+            spec_dirs+=("$project_path/$dir")
         fi
     done
 
+    # Read all markdown files in those directories
+    if [[ ${#spec_dirs[@]} -gt 0 ]]; then
+        while IFS= read -r -d '' file; do
+            local relpath="${file#"$project_path"/}"
+            echo "📄 Reading: $relpath" >&2
+
+            if [[ -n "$requirements" ]]; then
+                requirements="$requirements
+
+--- From $relpath ---
+$(<"$file")"
+            else
+                requirements="$(<"$file")"
+            fi
+        done < <(find "${spec_dirs[@]}" -name "*.md" -type f -print0 2>/dev/null)
+    fi
+
     # Also check root-level files (common patterns)
     local root_files=(
         "requirements.md" "REQUIREMENTS.md" "specs.md" "SPECS.md"
@@ -156,9 +158,9 @@ $(cat "$file")"
                 requirements="$requirements
 
 --- From $file ---
-$(cat "$full_file")"
+$(<"$full_file")"
             else
-                requirements="$(cat "$full_file")"
+                requirements="$(<"$full_file")"
             fi
         fi
     done
@@ -172,115 +174,132 @@ $(cat "$full_file")"
     fi
 }
 
-# Start agent with simple prompt
+# Wait until Claude is up in a window, giving up at CLAUDE_DEADLINE
+# (or 8s from now when it is unset).
+# With --dangerously-skip-permissions the footer reads
+# "⏵⏵ bypass permissions on (shift+tab to cycle)" once Claude is ready.
+wait_for_claude() {
+    local target="$1"
+    local deadline=${CLAUDE_DEADLINE:-$((SECONDS + 8))}
+
+    until tmux capture-pane -p -t "$target" 2>/dev/null | grep -qF "bypass permissions on"; do
+        if (( SECONDS >= deadline )); then
+            echo "Warning: Claude not ready in $target, sending anyway"
+            return 0
+        fi
+        sleep 0.5
+    done
+}
+
+# Brief an agent with simple prompt (Claude must already be launched).
+# The briefing is only pasted; main() submits all briefings together.
 start_agent() {
     local window="$1"
     local role="$2"
     local project_type="$3"
+    local target="$SESSION_NAME:$window"
 
     echo "Starting $role in window $window..."
-    tmux send-keys -t "$SESSION_NAME:$window" "claude --dangerously-skip-permissions" Enter
-    sleep 8  # Increased wait time for Claude to fully start
-
-    # Load custom requirements
-    local custom_req=$(load_custom_requirements "$PROJECT_PATH")
+    wait_for_claude "$target"
 
     # Base requirements message
     local base_msg=""
     local custom_suffix=""
 
-    if [[ -n "$custom_req" ]]; then
-        custom_suffix=" IMPORTANT: Follow these custom project requirements: $custom_req"
+    if [[ -n "$CUSTOM_REQUIREMENTS" ]]; then
+        custom_suffix=" IMPORTANT: Follow these custom project requirements: $CUSTOM_REQUIREMENTS"
     fi
 
     case "$role" in
         "pm")
-            base_msg="You are the Project Manager in $PROJECT_PATH. Your tools: send messages with '$ORCHESTRATOR_DIR/send-claude-message.sh <window> <message>', schedule checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Collect team status every 5 minutes with 'STATUS?'. Enforce 80% test coverage. Block bad merges. Report to orchestrator. ACTION NOW: 1) Check git status 2) Send 'STATUS?' to all team members 3) Schedule your next check with: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Team standup' '$SESSION_NAME:$window'"
-            send_message "$SESSION_NAME:$window" "$base_msg$custom_suffix"
+            base_msg="You are the Project Manager in $PROJECT_PATH. Your tools: send messages with '$ORCHESTRATOR_DIR/send-claude-message.sh <window> <message>', schedule checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Collect team status every 5 minutes with 'STATUS?'. Enforce 80% test coverage. Block bad merges. Report to orchestrator. ACTION NOW: 1) Check git status 2) Send 'STATUS?' to all team members 3) Schedule your next check with: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Team standup' '$target'"
             ;;
         "dev")
-            base_msg="You are a Developer in $PROJECT_PATH. Your tools: schedule self-checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Commit every 5 minutes max. Use 'feat:', 'fix:', 'test:' in commits. Write tests for everything (80%+ coverage). Work on feature branches only. ACTION NOW: 1) Run 'git status' 2) Create feature branch 3) Start implementing and schedule check: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Dev progress check' '$SESSION_NAME:$window'"
-            send_message "$SESSION_NAME:$window" "$base_msg$custom_suffix"
+            base_msg="You are a Developer in $PROJECT_PATH. Your tools: schedule self-checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Commit every 5 minutes max. Use 'feat:', 'fix:', 'test:' in commits. Write tests for everything (80%+ coverage). Work on feature branches only. ACTION NOW: 1) Run 'git status' 2) Create feature branch 3) Start implementing and schedule check: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Dev progress check' '$target'"
             ;;
         "lead")
-            base_msg="You are the Lead Developer in $PROJECT_PATH. Your tools: send messages with '$ORCHESTRATOR_DIR/send-claude-message.sh <window> <message>', schedule checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Make architecture decisions. Review complex code. Handle difficult technical problems. Guide other developers. ACTION NOW: 1) Review project structure 2) Create technical roadmap 3) Schedule review: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Architecture review' '$SESSION_NAME:$window'"
-            send_message "$SESSION_NAME:$window" "$base_msg$custom_suffix"
+            base_msg="You are the Lead Developer in $PROJECT_PATH. Your tools: send messages with '$ORCHESTRATOR_DIR/send-claude-message.sh <window> <message>', schedule checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Make architecture decisions. Review complex code. Handle difficult technical problems. Guide other developers. ACTION NOW: 1) Review project structure 2) Create technical roadmap 3) Schedule review: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Architecture review' '$target'"
             ;;
         "qa")
-            base_msg="You are the QA Engineer in $PROJECT_PATH. Your tools: schedule self-checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Ensure 80% test coverage minimum. Set up test automation. Write comprehensive test suites. Block releases that fail tests. ACTION NOW: 1) Check current test coverage 2) Create test plan 3) Schedule check: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Test coverage update' '$SESSION_NAME:$window'"
-            send_message "$SESSION_NAME:$window" "$base_msg$custom_suffix"
+            base_msg="You are the QA Engineer in $PROJECT_PATH. Your tools: schedule self-checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Ensure 80% test coverage minimum. Set up test automation. Write comprehensive test suites. Block releases that fail tests. ACTION NOW: 1) Check current test coverage 2) Create test plan 3) Schedule check: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Test coverage update' '$target'"
             ;;
         "devops")
-            base_msg="You are the DevOps Engineer in $PROJECT_PATH. Your tools: schedule self-checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Set up CI/CD pipelines. Manage deployments. Monitor system health. Handle infrastructure. ACTION NOW: 1) Review deployment process 2) Set up monitoring 3) Schedule check: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Infrastructure health' '$SESSION_NAME:$window'"
-            send_message "$SESSION_NAME:$window" "$base_msg$custom_suffix"
+            base_msg="You are the DevOps Engineer in $PROJECT_PATH. Your tools: schedule self-checks with '$ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>'. Set up CI/CD pipelines. Manage deployments. Monitor system health. Handle infrastructure. ACTION NOW: 1) Review deployment process 2) Set up monitoring 3) Schedule check: $ORCHESTRATOR_DIR/schedule_with_note.sh 5 'Infrastructure health' '$target'"
             ;;
     esac
+
+    if [[ -n "$base_msg" ]]; then
+        paste_message "$target" "$base_msg$custom_suffix"
+    fi
 }
 
 # Create session and deploy team
 main() {
     echo "🚀 Starting tmux orchestrator for $PROJECT_NAME"
 
+    # Get the directory where this orchestrator script is located
+    # (BASH_SOURCE, so it is also right when the script is sourced)
+    ORCHESTRATOR_DIR=$(dirname "$(realpath "${BASH_SOURCE[0]}")")
+
     # Detect project
     PROJECT_TYPE=$(detect_project_type)
     TEAM_SIZE=$(get_team_size)
 
     echo "📦 Project: $PROJECT_TYPE ($TEAM_SIZE team), path: $PROJECT_PATH, session: $SESSION_NAME"
 
-    # Kill existing session
-    tmux kill-session -t "$SESSION_NAME" 2>/dev/null || true
-
-    # Create session
-    tmux new-session -d -s "$SESSION_NAME" -c "$PROJECT_PATH" -n "Orchestrator"
-    tmux new-window -t "$SESSION_NAME" -n "Shell" -c "$PROJECT_PATH"
-    tmux new-window -t "$SESSION_NAME" -n "Dev-Server" -c "$PROJECT_PATH"
-    tmux new-window -t "$SESSION_NAME" -n "Tests" -c "$PROJECT_PATH"
+    # Load custom requirements once; every agent and the orchestrator share them
+    CUSTOM_REQUIREMENTS=$(load_custom_requirements "$PROJECT_PATH") || true
 
-    # Start development server
-    start_dev_server "$PROJECT_TYPE" "Dev-Server"
-
-    # Deploy team based on size
+    # Pick team based on size (window:role)
+    local agents=()
     case "$TEAM_SIZE" in
         "small")
-            tmux new-window -t "$SESSION_NAME" -n "Agent-PM" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-Dev" -c "$PROJECT_PATH"
-            start_agent "Agent-PM" "pm" "$PROJECT_TYPE"
-            start_agent "Agent-Dev" "dev" "$PROJECT_TYPE"
+            agents=("Agent-PM:pm" "Agent-Dev:dev")
             ;;
         "medium")
-            tmux new-window -t "$SESSION_NAME" -n "Agent-PM" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-Lead" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-Dev" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-QA" -c "$PROJECT_PATH"
-            start_agent "Agent-PM" "pm" "$PROJECT_TYPE"
-            start_agent "Agent-Lead" "lead" "$PROJECT_TYPE"
-            start_agent "Agent-Dev" "dev" "$PROJECT_TYPE"
-            start_agent "Agent-QA" "qa" "$PROJECT_TYPE"
+            agents=("Agent-PM:pm" "Agent-Lead:lead" "Agent-Dev:dev" "Agent-QA:qa")
             ;;
         "large")
-            tmux new-window -t "$SESSION_NAME" -n "Agent-PM" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-Tech-Lead" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-Senior-Dev" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-Dev" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-QA" -c "$PROJECT_PATH"
-            tmux new-window -t "$SESSION_NAME" -n "Agent-DevOps" -c "$PROJECT_PATH"
-            start_agent "Agent-PM" "pm" "$PROJECT_TYPE"
-            start_agent "Agent-Tech-Lead" "lead" "$PROJECT_TYPE"
-            start_agent "Agent-Senior-Dev" "dev" "$PROJECT_TYPE"
-            start_agent "Agent-Dev" "dev" "$PROJECT_TYPE"
-            start_agent "Agent-QA" "qa" "$PROJECT_TYPE"
-            start_agent "Agent-DevOps" "devops" "$PROJECT_TYPE"
+            agents=("Agent-PM:pm" "Agent-Tech-Lead:lead" "Agent-Senior-Dev:dev"
+                    "Agent-Dev:dev" "Agent-QA:qa" "Agent-DevOps:devops")
             ;;
     esac
 
+    # Kill existing session
+    tmux kill-session -t "$SESSION_NAME" 2>/dev/null || true
+
+    # Create session and all windows, and launch Claude in the orchestrator
+    # and every agent window, in a single tmux invocation. All instances
+    # start up concurrently, so we only wait once, not once per agent.
+    local tmux_cmd=(new-session -d -s "$SESSION_NAME" -c "$PROJECT_PATH" -n "Orchestrator")
+    local window
+    for window in "Shell" "Dev-Server" "Tests" "${agents[@]%%:*}"; do
+        tmux_cmd+=(\; new-window -t "$SESSION_NAME" -n "$window" -c "$PROJECT_PATH")
+    done
+    for window in "Orchestrator" "${agents[@]%%:*}"; do
+        echo "Launching Claude in window $window..."
+        tmux_cmd+=(\; send-keys -t "$SESSION_NAME:$window" "claude --dangerously-skip-permissions" Enter)
+    done
+    tmux "${tmux_cmd[@]}"
+
+    # Start development server
+    start_dev_server "$PROJECT_TYPE" "Dev-Server"
+
+    # Give Claude up to 8s to fully start; briefings go out as each one is ready
+    CLAUDE_DEADLINE=$((SECONDS + 8))
+
+    # Deploy team
+    local agent
+    for agent in "${agents[@]}"; do
+        start_agent "${agent%%:*}" "${agent#*:}" "$PROJECT_TYPE"
+    done
+
     # Start orchestrator
+    local orchestrator_target="$SESSION_NAME:Orchestrator"
     echo "Starting orchestrator in Orchestrator window..."
-    tmux select-window -t "$SESSION_NAME:Orchestrator"
-    tmux send-keys -t "$SESSION_NAME:Orchestrator" "claude --dangerously-skip-permissions" Enter
-    sleep 8
+    tmux select-window -t "$orchestrator_target"
+    wait_for_claude "$orchestrator_target"
 
-    # Load custom requirements for orchestrator
-    local custom_req=$(load_custom_requirements "$PROJECT_PATH")
     local orchestrator_msg="You are the Orchestrator for this $PROJECT_TYPE project ($TEAM_SIZE team) in directory $PROJECT_PATH. Your team is deployed in these windows: $(tmux list-windows -t "$SESSION_NAME" -F '#{window_name}' | grep 'Agent-' | tr '\n' ', ' | sed 's/, $//').
 
 YOUR TOOLS:
@@ -288,22 +307,43 @@ YOUR TOOLS:
 - Schedule checks: $ORCHESTRATOR_DIR/schedule_with_note.sh <minutes> <note> <window>
 
 ACTION NOW:
-1. Schedule your recurring health check: $ORCHESTRATOR_DIR/schedule_with_note.sh 15 'Health check all agents' '$SESSION_NAME:Orchestrator'
+1. Schedule your recurring health check: $ORCHESTRATOR_DIR/schedule_with_note.sh 15 'Health check all agents' '$orchestrator_target'
 2. Send initial ping to all agents to verify they're active
 3. Monitor for blockers and conflicts
 
 Remember: Agents will self-schedule and report status. You coordinate and resolve issues."
     
-    if [[ -n "$custom_req" ]]; then
-        orchestrator_msg="$orchestrator_msg IMPORTANT: Follow these custom project requirements: $custom_req"
+    if [[ -n "$CUSTOM_REQUIREMENTS" ]]; then
+        orchestrator_msg="$orchestrator_msg IMPORTANT: Follow these custom project requirements: $CUSTOM_REQUIREMENTS"
     fi
     
     # Brief orchestrator
-    send_message "$SESSION_NAME:Orchestrator" "$orchestrator_msg"
+    paste_message "$orchestrator_target" "$orchestrator_msg"
+
+    # Wait once for every UI to register its paste, then submit them all
+    sleep 0.5
+    for agent in "${agents[@]}"; do
+        submit_message "$SESSION_NAME:${agent%%:*}"
+    done
+    submit_message "$orchestrator_target"
 
     echo "✅ Orchestrator deployed!"
     echo "📌 Attach: tmux attach -t $SESSION_NAME"
     echo "🎯 Team: $TEAM_SIZE ($PROJECT_TYPE)"
 }
 
-main
+# Run main only when executed directly, so tests can source the functions
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    PROJECT_PATH="$1"
+
+    if [[ -z "$PROJECT_PATH" || ! -d "$PROJECT_PATH" ]]; then
+        echo "Usage: $0 /path/to/project"
+        exit 1
+    fi
+
+    PROJECT_PATH=$(realpath "$PROJECT_PATH")
+    PROJECT_NAME=$(basename "$PROJECT_PATH")
+    SESSION_NAME=$(echo "$PROJECT_NAME" | tr ' A-Z' '-a-z' | sed 's/^\.//g')
+
+    main
+fi
@@ -9,10 +9,15 @@ PROJECT_DIR=$HOME/work
 NOTE_FILE=$PROJECT_DIR/next_check_note.txt
 
 # Create a note file for the next check
-echo "=== Next Check Note ($(date)) ===" > $NOTE_FILE
-echo "Scheduled for: $MINUTES minutes" >> $NOTE_FILE
-echo "" >> $NOTE_FILE
-echo "$NOTE" >> $NOTE_FILE
+# Written in one go to a unique temp file and moved into place, so a
+# reader never sees a partially written note, even with concurrent runs
+NOTE_TMP=$(mktemp "$NOTE_FILE.XXXXXX")
+{
+    echo "=== Next Check Note ($(date)) ==="
+    echo "Scheduled for: $MINUTES minutes"
+    echo ""
+    echo "$NOTE"
+} > "$NOTE_TMP" && mv "$NOTE_TMP" "$NOTE_FILE"
 
 echo "Scheduling check in $MINUTES minutes with note: $NOTE"
 
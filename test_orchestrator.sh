@@ -64,62 +64,9 @@ cleanup() {
 
 trap cleanup EXIT
 
-# Extract functions from orchestrator.sh for testing
-# We need to source the functions without executing main()
-detect_project_type() {
-    if [[ -f "$PROJECT_PATH/package.json" ]]; then
-        if grep -q "react" "$PROJECT_PATH/package.json" 2>/dev/null; then
-            echo "react"
-        else
-            echo "nodejs"
-        fi
-    elif [[ -f "$PROJECT_PATH/manage.py" ]]; then
-        echo "django"
-    elif [[ -f "$PROJECT_PATH/requirements.txt" ]]; then
-        echo "python"
-    elif [[ -f "$PROJECT_PATH/go.mod" ]]; then
-        echo "go"
-    elif [[ -f "$PROJECT_PATH/Cargo.toml" ]]; then
-        echo "rust"
-    else
-        echo "unknown"
-    fi
-}
-
-get_team_size() {
-    local loc=$(find "$PROJECT_PATH" -name "*.py" -o -name "*.js" -o -name "*.ts" -exec wc -l {} + 2>/dev/null | tail -1 | awk '{print $1}' || echo "0")
-    echo "DEBUG get_team_size: PROJECT_PATH=$PROJECT_PATH, loc=$loc" >&2
-    
-    if [[ $loc -lt 1000 ]]; then
-        echo "small"
-    elif [[ $loc -lt 10000 ]]; then
-        echo "medium" 
-    else
-        echo "large"
-    fi
-}
-
-send_message() {
-    local target="$1"
-    local message="$2"
-    
-    # Check if window exists before sending message
-    # Support both window:name and session:window formats
-    local session="${target%:*}"
-    local window="${target#*:}"
-    
-    if ! tmux list-windows -t "$session" -F '#{window_name}' | grep -q "^${window}$"; then
-        echo "Warning: Window $target not found, skipping message"
-        return 1
-    fi
-    
-    echo "$message" | tmux load-buffer -
-    tmux paste-buffer -t "$target" 2>/dev/null || {
-        echo "Warning: Failed to send message to $target"
-        return 1
-    }
-    tmux send-keys -t "$target" Enter
-}
+# Source the functions under test; orchestrator.sh only runs main()
+# when executed directly
+source "$SCRIPT_DIR/orchestrator.sh"
 
 # Test project type detection
 test_project_type_detection() {
@@ -149,6 +96,29 @@ test_project_type_detection() {
     echo "✅ Project type detection tests passed"
 }
 
+# Test custom requirements loading
+test_custom_requirements() {
+    echo "Testing custom requirements loading..."
+
+    rm -rf "$TEST_PROJECT_DIR" && mkdir -p "$TEST_PROJECT_DIR/specs" "$TEST_PROJECT_DIR/docs/sub"
+    echo "# Spec A" > "$TEST_PROJECT_DIR/specs/a.md"
+    echo "# Doc B" > "$TEST_PROJECT_DIR/docs/sub/b.md"
+    echo "# Readme" > "$TEST_PROJECT_DIR/README.md"
+
+    result=$(load_custom_requirements "$TEST_PROJECT_DIR" 2>/dev/null)
+    expected=$'# Spec A\n\n--- From docs/sub/b.md ---\n# Doc B\n\n--- From README.md ---\n# Readme'
+    [ "$result" = "$expected" ] || { echo "FAIL: Unexpected requirements:"; echo "$result"; return 1; }
+    echo "✓ Spec directories and root files are concatenated with relative-path headers"
+
+    rm -rf "$TEST_PROJECT_DIR" && mkdir -p "$TEST_PROJECT_DIR"
+    if load_custom_requirements "$TEST_PROJECT_DIR" >/dev/null 2>&1; then
+        echo "FAIL: Expected failure when no specs exist"; return 1
+    fi
+    echo "✓ Missing specs are reported"
+
+    echo "✅ Custom requirements loading tests passed"
+}
+
 # Test team size calculation
 test_team_size_calculation() {
     echo "Testing team size calculation..."
@@ -248,6 +218,40 @@ test_message_sending() {
     echo "✅ Message sending tests passed"
 }
 
+# Test Claude readiness polling
+test_wait_for_claude() {
+    echo "Testing Claude readiness polling..."
+
+    # One window shows the bypass-permissions footer after a second, the other never does
+    tmux new-session -d -s "$TEST_SESSION" -n "ready" \
+        "sleep 1; echo '  ⏵⏵ bypass permissions on (shift+tab to cycle)'; sleep 30" 2>/dev/null || {
+        echo "✓ Skipping readiness polling (tmux session not available)"
+        return 0
+    }
+    tmux new-window -t "$TEST_SESSION" -n "idle" "sleep 30"
+
+    CLAUDE_DEADLINE=$((SECONDS + 4))
+    result=$(wait_for_claude "$TEST_SESSION:ready")
+    [ -z "$result" ] || { echo "FAIL: Expected ready window without warning, got '$result'"; return 1; }
+    [ $SECONDS -lt $CLAUDE_DEADLINE ] || { echo "FAIL: Ready window waited until the deadline"; return 1; }
+    echo "✓ Returns early once Claude is ready"
+
+    result=$(wait_for_claude "$TEST_SESSION:idle")
+    [[ "$result" == *"Warning: Claude not ready"* ]] || { echo "FAIL: Expected deadline warning, got '$result'"; return 1; }
+    [ $SECONDS -ge $CLAUDE_DEADLINE ] || { echo "FAIL: Idle window returned before the deadline"; return 1; }
+    echo "✓ Falls back to the deadline when Claude never shows up"
+
+    unset CLAUDE_DEADLINE
+    start=$SECONDS
+    result=$(wait_for_claude "$TEST_SESSION:idle")
+    [[ "$result" == *"Warning: Claude not ready"* ]] || { echo "FAIL: Expected deadline warning, got '$result'"; return 1; }
+    [ $((SECONDS - start)) -ge 7 ] || { echo "FAIL: Unset deadline gave up after $((SECONDS - start))s, expected 8s"; return 1; }
+    echo "✓ Waits 8s by default when no deadline is set"
+
+    tmux kill-session -t "$TEST_SESSION" 2>/dev/null || true
+    echo "✅ Claude readiness polling tests passed"
+}
+
 # Test error handling
 test_error_handling() {
     echo "Testing error handling..."
@@ -305,7 +309,9 @@ run_tests() {
     
     test_project_type_detection || failed=$((failed + 1))
     test_team_size_calculation || failed=$((failed + 1))
+    test_custom_requirements || failed=$((failed + 1))
     test_message_sending || failed=$((failed + 1))
+    test_wait_for_claude || failed=$((failed + 1))
     test_error_handling || failed=$((failed + 1))
     test_schedule_script || failed=$((failed + 1))
     test_send_message_script || failed=$((failed + 1))